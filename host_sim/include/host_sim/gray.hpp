@@ -7,11 +7,13 @@ namespace host_sim
 
 inline uint16_t gray_decode(uint16_t symbol)
 {
-    uint16_t result = symbol;
-    while (symbol >>= 1u) {
-        result ^= symbol;
-    }
-    return result;
+    // Prefix XOR of all higher bits, folded in log2(16) steps instead of one
+    // loop iteration per significant bit.
+    symbol ^= static_cast<uint16_t>(symbol >> 1u);
+    symbol ^= static_cast<uint16_t>(symbol >> 2u);
+    symbol ^= static_cast<uint16_t>(symbol >> 4u);
+    symbol ^= static_cast<uint16_t>(symbol >> 8u);
+    return symbol;
 }
 
 } // namespace host_sim
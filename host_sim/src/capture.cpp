@@ -80,18 +80,20 @@ void set_stdin_binary()
 std::vector<std::complex<float>> load_cf32_stdin()
 {
     set_stdin_binary();
-    constexpr std::size_t chunk_floats = 65536; // 32K complex samples per read
+    constexpr std::size_t chunk_samples = 32768; // 32K complex samples per read
     std::vector<std::complex<float>> samples;
-    std::vector<float> buf(chunk_floats);
 
     while (true) {
-        const auto n = std::fread(buf.data(), sizeof(float), chunk_floats, stdin);
-        if (n == 0) break;
-        // Ensure pairs (drop trailing lone float if any)
-        const auto pairs = (n / 2) * 2;
-        for (std::size_t i = 0; i < pairs; i += 2) {
-            samples.emplace_back(buf[i], buf[i + 1]);
-        }
+        // Read straight into the sample buffer: complex<float> is
+        // layout-compatible with float[2], so no staging copy is needed.
+        const std::size_t old_size = samples.size();
+        samples.resize(old_size + chunk_samples);
+        const auto n = std::fread(
+            reinterpret_cast<float*>(samples.data() + old_size),
+            sizeof(float), chunk_samples * 2, stdin);
+        // Keep whole pairs only (drop trailing lone float if any)
+        samples.resize(old_size + n / 2);
+        if (n < chunk_samples * 2) break;
     }
     if (samples.empty()) {
         throw std::runtime_error("No IQ samples read from stdin");
@@ -10,24 +10,6 @@ namespace host_sim
 namespace
 {
 
-std::vector<bool> int_to_bits(uint16_t value, int bit_count)
-{
-    std::vector<bool> bits(bit_count);
-    for (int i = 0; i < bit_count; ++i) {
-        bits[bit_count - 1 - i] = (value >> i) & 0x1u;
-    }
-    return bits;
-}
-
-uint8_t bits_to_uint8(const std::vector<bool>& bits)
-{
-    uint8_t result = 0;
-    for (bool bit : bits) {
-        result = static_cast<uint8_t>((result << 1) | (bit ? 1 : 0));
-    }
-    return result;
-}
-
 inline int modulo(int a, int m)
 {
     int result = a % m;
@@ -48,7 +30,10 @@ std::vector<uint8_t> deinterleave(const std::vector<uint16_t>& symbols, const De
         throw std::runtime_error("Not enough symbols to deinterleave block");
     }
 
-    std::vector<std::vector<bool>> inter_matrix(cw_len);
+    // Scatter each symbol's gray-mapped bits straight into the packed
+    // codeword bytes: bit j of symbol i lands in row (i - j - 1) mod sf_app
+    // at bit position (cw_len - 1 - i).
+    std::vector<uint8_t> result(sf_app, 0);
     const uint16_t mask_full = static_cast<uint16_t>((1u << cfg.sf) - 1u);
     const uint16_t mask_app = static_cast<uint16_t>((1u << sf_app) - 1u);
     for (int i = 0; i < cw_len; ++i) {
@@ -58,23 +43,16 @@ std::vector<uint8_t> deinterleave(const std::vector<uint16_t>& symbols, const De
             raw = static_cast<uint16_t>(raw >> 2);
         }
         const uint16_t gray_input = raw;
-        const uint16_t mapped = static_cast<uint16_t>(gray_input ^ (gray_input >> 1));
-        inter_matrix[i] = int_to_bits(mapped & mask_app, sf_app);
-    }
-
-    std::vector<std::vector<bool>> deinter_matrix(sf_app, std::vector<bool>(cw_len));
-    for (int i = 0; i < cw_len; ++i) {
+        const uint16_t mapped = static_cast<uint16_t>((gray_input ^ (gray_input >> 1)) & mask_app);
+        const unsigned out_shift = static_cast<unsigned>(cw_len - 1 - i);
+        int row = modulo(i - 1, sf_app);
         for (int j = 0; j < sf_app; ++j) {
-            const int row = modulo(i - j - 1, sf_app);
-            deinter_matrix[row][i] = inter_matrix[i][j];
+            const unsigned bit = (mapped >> (sf_app - 1 - j)) & 0x1u;
+            result[row] = static_cast<uint8_t>(result[row] | (bit << out_shift));
+            row = (row == 0) ? sf_app - 1 : row - 1;
         }
     }
 
-    std::vector<uint8_t> result(sf_app);
-    for (int i = 0; i < sf_app; ++i) {
-        result[i] = bits_to_uint8(deinter_matrix[i]);
-    }
-
     consumed = cw_len;
     return result;
 }
@@ -1,74 +1,59 @@
 #include "host_sim/hamming.hpp"
 
-#include <algorithm>
+#include <bit>
 
 namespace host_sim
 {
 
 uint8_t hamming_decode(uint8_t codeword, int cr_app)
 {
-    std::vector<bool> bits(cr_app + 4);
-    for (std::size_t i = 0; i < bits.size(); ++i) {
-        bits[bits.size() - 1 - i] = (codeword >> i) & 0x1u;
-    }
-
-    std::vector<bool> data = {bits[3], bits[2], bits[1], bits[0]};
+    // Work on the codeword bits in place: bit(k) is the k-th transmitted bit,
+    // MSB first, so bit(0..3) are the data bits and the rest are checks.
+    const int cw_len = cr_app + 4;
+    const auto bit = [codeword, cw_len](int k) {
+        return static_cast<unsigned>((codeword >> (cw_len - 1 - k)) & 0x1u);
+    };
 
-    bool s0 = false;
-    bool s1 = false;
-    bool s2 = false;
+    uint8_t data = static_cast<uint8_t>((bit(3) << 3) | (bit(2) << 2) | (bit(1) << 1) | bit(0));
 
     switch (cr_app) {
     case 4:
-        if ((std::count(bits.begin(), bits.end(), true) % 2) == 0) {
+        if ((std::popcount(static_cast<unsigned>(codeword)) % 2) == 0) {
             break;
         }
         [[fallthrough]];
-    case 3:
-        s0 = bits[0] ^ bits[1] ^ bits[2] ^ bits[4];
-        s1 = bits[1] ^ bits[2] ^ bits[3] ^ bits[5];
-        s2 = bits[0] ^ bits[1] ^ bits[3] ^ bits[6];
-        {
-            const int syndrom = static_cast<int>(s0) | (static_cast<int>(s1) << 1) | (static_cast<int>(s2) << 2);
-            switch (syndrom) {
-            case 5:
-                data[3].flip();
-                break;
-            case 7:
-                data[2].flip();
-                break;
-            case 3:
-                data[1].flip();
-                break;
-            case 6:
-                data[0].flip();
-                break;
-            default:
-                break;
-            }
+    case 3: {
+        const unsigned s0 = bit(0) ^ bit(1) ^ bit(2) ^ bit(4);
+        const unsigned s1 = bit(1) ^ bit(2) ^ bit(3) ^ bit(5);
+        const unsigned s2 = bit(0) ^ bit(1) ^ bit(3) ^ bit(6);
+        const unsigned syndrom = s0 | (s1 << 1) | (s2 << 2);
+        switch (syndrom) {
+        case 5:
+            data ^= 0x1u;
+            break;
+        case 7:
+            data ^= 0x2u;
+            break;
+        case 3:
+            data ^= 0x4u;
+            break;
+        case 6:
+            data ^= 0x8u;
+            break;
+        default:
+            break;
         }
         break;
+    }
     case 2:
-        s0 = bits[0] ^ bits[1] ^ bits[2] ^ bits[4];
-        s1 = bits[1] ^ bits[2] ^ bits[3] ^ bits[5];
-        if (s0 || s1) {
-            // not corrected
-        }
-        break;
     case 1:
-        if ((std::count(bits.begin(), bits.end(), true) % 2) == 0) {
-            // parity fail -> ignore
-        }
+        // Detection only: syndrome or parity failures are not corrected.
         break;
     default:
         break;
     }
 
-    uint8_t result = 0;
-    for (bool bit : data) {
-        result = static_cast<uint8_t>((result << 1) | (bit ? 1 : 0));
-    }
-    return result;
+    return data;
 }
 
 std::vector<uint8_t> hamming_decode_block(const std::vector<uint8_t>& codewords, bool header, int cr)
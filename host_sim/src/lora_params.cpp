@@ -3,6 +3,7 @@
 #include <algorithm>
 #include <cctype>
 #include <fstream>
+#include <iterator>
 #include <stdexcept>
 #include <string>
 
@@ -13,17 +14,16 @@ std::string read_file(const std::filesystem::path& path)
 {
     std::ifstream input(path);
     if (!input) {
+        // Only probe the filesystem once opening has failed, so a successful
+        // load touches the file once.
+        if (!std::filesystem::exists(path)) {
+            throw std::runtime_error("Metadata JSON not found: " + path.string());
+        }
         throw std::runtime_error("Failed to open metadata JSON: " + path.string());
     }
     return std::string(std::istreambuf_iterator<char>(input), std::istreambuf_iterator<char>());
 }
 
-std::string strip_spaces(std::string value)
-{
-    value.erase(std::remove_if(value.begin(), value.end(), [](unsigned char ch) { return std::isspace(ch); }), value.end());
-    return value;
-}
-
 std::optional<std::string> find_value(const std::string& content, const std::string& key)
 {
     const std::string pattern = "\"" + key + "\"";
@@ -53,8 +53,15 @@ std::optional<std::string> find_value(const std::string& content, const std::str
         }
         ++end;
     }
-    std::string raw = content.substr(start, end - start);
-    return strip_spaces(raw);
+    // Copy the token with whitespace dropped in one pass rather than taking a
+    // substring and erasing from it.
+    std::string value;
+    value.reserve(end - start);
+    std::copy_if(content.begin() + static_cast<std::ptrdiff_t>(start),
+                 content.begin() + static_cast<std::ptrdiff_t>(end),
+                 std::back_inserter(value),
+                 [](unsigned char ch) { return !std::isspace(ch); });
+    return value;
 }
 
 int parse_int(const std::string& token, int default_value)
@@ -95,10 +102,6 @@ namespace host_sim
 
 LoRaMetadata load_metadata(const std::filesystem::path& path)
 {
-    if (!std::filesystem::exists(path)) {
-        throw std::runtime_error("Metadata JSON not found: " + path.string());
-    }
-
     const auto content = read_file(path);
     LoRaMetadata meta;
 
@@ -33,14 +33,16 @@
 namespace
 {
 
+// Non-owning view over the loaded capture: the caller keeps the samples alive
+// for the source's lifetime, so no second full-size copy is made.
 class FileSymbolSource : public host_sim::SymbolSource
 {
 public:
-    FileSymbolSource(std::vector<std::complex<float>> samples,
+    FileSymbolSource(std::span<const std::complex<float>> samples,
                      std::size_t alignment_offset,
                      std::size_t samples_per_symbol,
                      std::size_t symbol_count)
-        : samples_(std::move(samples)),
+        : samples_(samples),
           offset_(alignment_offset),
           samples_per_symbol_(samples_per_symbol),
           symbol_count_(symbol_count)
@@ -68,7 +70,7 @@ public:
     }
 
 private:
-    std::vector<std::complex<float>> samples_;
+    std::span<const std::complex<float>> samples_;
     std::size_t offset_;
     std::size_t samples_per_symbol_;
     std::size_t symbol_count_;
@@ -100,6 +102,20 @@ std::size_t compute_samples_per_symbol(const host_sim::LoRaMetadata& meta)
     return static_cast<std::size_t>((static_cast<long long>(meta.sample_rate) * chips) / meta.bw);
 }
 
+// Render bytes as " xx xx ..." (lowercase hex) into one string so payload
+// dumps are a single stream write rather than per-byte manipulator calls.
+std::string format_hex_bytes(const std::vector<uint8_t>& bytes, std::size_t count)
+{
+    static constexpr char kHexDigits[] = "0123456789abcdef";
+    count = std::min(count, bytes.size());
+    std::string text(count * 3, ' ');
+    for (std::size_t i = 0; i < count; ++i) {
+        text[i * 3 + 1] = kHexDigits[bytes[i] >> 4];
+        text[i * 3 + 2] = kHexDigits[bytes[i] & 0x0F];
+    }
+    return text;
+}
+
 struct InstrumentationResult
 {
     std::vector<double> stage_timings_ns;
@@ -1330,16 +1346,10 @@ int main(int argc, char** argv)
                     }
 
                     // Print payload
-                    std::cout << "Payload bytes (dewhitened):";
-                    for (std::size_t i = 0;
-                         i < std::min<std::size_t>(dewhitened.size(),
-                                                    static_cast<std::size_t>(payload_len));
-                         ++i) {
-                        std::cout << ' ' << std::hex << std::setw(2)
-                                  << std::setfill('0')
-                                  << static_cast<int>(dewhitened[i]);
-                    }
-                    std::cout << std::dec << "\n";
+                    std::cout << "Payload bytes (dewhitened):"
+                              << format_hex_bytes(dewhitened,
+                                                  static_cast<std::size_t>(payload_len))
+                              << "\n";
 
                     // ASCII
                     std::cout << "Payload ASCII: ";
@@ -2611,12 +2621,9 @@ int main(int argc, char** argv)
                 if (unwhitened.size() > static_cast<std::size_t>(expected_payload_len) + (expected_crc ? 2u : 0u)) {
                     unwhitened.resize(static_cast<std::size_t>(expected_payload_len) + (expected_crc ? 2u : 0u));
                 }
-                std::cout << "Payload bytes (dewhitened):";
-                for (std::size_t i = 0; i < std::min<std::size_t>(unwhitened.size(), static_cast<std::size_t>(expected_payload_len)); ++i) {
-                    std::cout << ' ' << std::hex << std::setw(2) << std::setfill('0')
-                              << static_cast<int>(unwhitened[i]) << std::dec;
-                }
-                std::cout << "\n";
+                std::cout << "Payload bytes (dewhitened):"
+                          << format_hex_bytes(unwhitened, static_cast<std::size_t>(expected_payload_len))
+                          << "\n";
                 if (expected_payload_len > 0) {
                     std::string ascii(unwhitened.begin(), unwhitened.begin() + std::min<std::size_t>(static_cast<std::size_t>(expected_payload_len), unwhitened.size()));
                     std::cout << "Payload ASCII: " << ascii << "\n";
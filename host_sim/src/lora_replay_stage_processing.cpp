@@ -243,9 +243,19 @@ void write_summary_json(const std::filesystem::path& path, const SummaryReport&
         throw std::runtime_error("Failed to open summary output file: " + path.string());
     }
 
-    std::vector<std::string> fields;
+    // Stream each top-level field straight to the file instead of staging
+    // them as strings first; the per-symbol arrays can be long.
+    out << "{\n";
+    bool first_field = true;
+    auto next_field = [&]() -> std::ostream& {
+        if (!first_field) {
+            out << ",\n";
+        }
+        first_field = false;
+        return out;
+    };
     if (report.capture_path) {
-        fields.push_back("  \"capture\": \"" + json_escape(*report.capture_path) + "\"");
+        next_field() << "  \"capture\": \"" << json_escape(*report.capture_path) << "\"";
     }
     if (report.metadata) {
         const auto& meta = *report.metadata;
@@ -258,87 +268,76 @@ void write_summary_json(const std::filesystem::path& path, const SummaryReport&
         meta_fields.push_back("    \"preamble_len\": " + std::to_string(meta.preamble_len));
         meta_fields.push_back("    \"has_crc\": " + std::string(json_bool(meta.has_crc)));
 
-        std::ostringstream meta_ss;
-        meta_ss << "  \"metadata\": {\n";
+        next_field() << "  \"metadata\": {\n";
         for (std::size_t i = 0; i < meta_fields.size(); ++i) {
-            meta_ss << meta_fields[i];
+            out << meta_fields[i];
             if (i + 1 < meta_fields.size()) {
-                meta_ss << ',';
+                out << ',';
             }
-            meta_ss << '\n';
+            out << '\n';
         }
-        meta_ss << "  }";
-        fields.push_back(meta_ss.str());
+        out << "  }";
     }
     if (report.stats) {
         const auto& stats = *report.stats;
-        std::ostringstream stats_ss;
-        stats_ss << "  \"stats\": {\n"
-                 << "    \"sample_count\": " << stats.sample_count << ",\n"
-                 << "    \"min_magnitude\": " << stats.min_magnitude << ",\n"
-                 << "    \"max_magnitude\": " << stats.max_magnitude << ",\n"
-                 << "    \"mean_power\": " << stats.mean_power << "\n"
-                 << "  }";
-        fields.push_back(stats_ss.str());
+        next_field() << "  \"stats\": {\n"
+                     << "    \"sample_count\": " << stats.sample_count << ",\n"
+                     << "    \"min_magnitude\": " << stats.min_magnitude << ",\n"
+                     << "    \"max_magnitude\": " << stats.max_magnitude << ",\n"
+                     << "    \"mean_power\": " << stats.mean_power << "\n"
+                     << "  }";
     }
-    fields.push_back("  \"reference_mismatches\": " + std::to_string(report.reference_mismatches));
-    fields.push_back("  \"stage_mismatches\": " + std::to_string(report.stage_mismatches));
-    fields.push_back("  \"whitening_roundtrip_ok\": " + std::string(json_bool(report.whitening_roundtrip_ok)));
-    fields.push_back("  \"compare_run\": " + std::string(json_bool(report.compare_run)));
-    fields.push_back("  \"packet_error_rate\": " + std::to_string(report.packet_error_rate));
-    fields.push_back("  \"bit_error_rate\": " + std::to_string(report.bit_error_rate));
-    fields.push_back("  \"deadline_miss_count\": " + std::to_string(report.deadline_miss_count));
-    fields.push_back("  \"tracking_failure\": " + std::string(json_bool(report.tracking_failure)));
+    next_field() << "  \"reference_mismatches\": " << std::to_string(report.reference_mismatches);
+    next_field() << "  \"stage_mismatches\": " << std::to_string(report.stage_mismatches);
+    next_field() << "  \"whitening_roundtrip_ok\": " << json_bool(report.whitening_roundtrip_ok);
+    next_field() << "  \"compare_run\": " << json_bool(report.compare_run);
+    next_field() << "  \"packet_error_rate\": " << std::to_string(report.packet_error_rate);
+    next_field() << "  \"bit_error_rate\": " << std::to_string(report.bit_error_rate);
+    next_field() << "  \"deadline_miss_count\": " << std::to_string(report.deadline_miss_count);
+    next_field() << "  \"tracking_failure\": " << json_bool(report.tracking_failure);
     if (!report.tracking_failure_reason.empty()) {
-        fields.push_back("  \"tracking_failure_reason\": \""
-                         + json_escape(report.tracking_failure_reason) + "\"");
+        next_field() << "  \"tracking_failure_reason\": \""
+                     << json_escape(report.tracking_failure_reason) << "\"";
     }
     if (!report.tracking_mitigation.empty()) {
-        fields.push_back("  \"tracking_mitigation\": \""
-                         + json_escape(report.tracking_mitigation) + "\"");
+        next_field() << "  \"tracking_mitigation\": \""
+                     << json_escape(report.tracking_mitigation) << "\"";
     }
 
     if (!report.stage_timings_ns.empty()) {
-        std::ostringstream timings_ss;
-        timings_ss << "  \"stage_timings_ns\": [";
+        next_field() << "  \"stage_timings_ns\": [";
         for (std::size_t i = 0; i < report.stage_timings_ns.size(); ++i) {
             if (i > 0) {
-                timings_ss << ", ";
+                out << ", ";
             }
-            timings_ss << report.stage_timings_ns[i];
+            out << report.stage_timings_ns[i];
         }
-        timings_ss << "]";
-        fields.push_back(timings_ss.str());
+        out << "]";
     }
 
     if (!report.memory_usage_bytes.empty()) {
-        std::ostringstream mem_ss;
-        mem_ss << "  \"symbol_memory_bytes\": [";
+        next_field() << "  \"symbol_memory_bytes\": [";
         for (std::size_t i = 0; i < report.memory_usage_bytes.size(); ++i) {
             if (i > 0) {
-                mem_ss << ", ";
+                out << ", ";
             }
-            mem_ss << report.memory_usage_bytes[i];
+            out << report.memory_usage_bytes[i];
         }
-        mem_ss << "]";
-        fields.push_back(mem_ss.str());
+        out << "]";
     }
 
     if (!report.preview_symbols.empty()) {
-        std::ostringstream preview_ss;
-        preview_ss << "  \"preview_symbols\": [";
+        next_field() << "  \"preview_symbols\": [";
         for (std::size_t i = 0; i < report.preview_symbols.size(); ++i) {
-            preview_ss << report.preview_symbols[i];
+            out << report.preview_symbols[i];
             if (i + 1 < report.preview_symbols.size()) {
-                preview_ss << ", ";
+                out << ", ";
             }
         }
-        preview_ss << "]";
-        fields.push_back(preview_ss.str());
+        out << "]";
     }
     if (!report.stage_results.empty()) {
-        std::ostringstream stages_ss;
-        stages_ss << "  \"stage_results\": [\n";
+        next_field() << "  \"stage_results\": [\n";
         for (std::size_t i = 0; i < report.stage_results.size(); ++i) {
             const auto& res = report.stage_results[i];
             std::vector<std::string> stage_fields;
@@ -367,60 +366,50 @@ void write_summary_json(const std::filesystem::path& path, const SummaryReport&
                 stage_fields.push_back("      \"ref_value\": " + std::to_string(*res.ref_value));
             }
 
-            stages_ss << "    {\n";
+            out << "    {\n";
             for (std::size_t j = 0; j < stage_fields.size(); ++j) {
-                stages_ss << stage_fields[j];
+                out << stage_fields[j];
                 if (j + 1 < stage_fields.size()) {
-                    stages_ss << ',';
+                    out << ',';
                 }
-                stages_ss << '\n';
+                out << '\n';
             }
-            stages_ss << "    }";
+            out << "    }";
             if (i + 1 < report.stage_results.size()) {
-                stages_ss << ',';
+                out << ',';
             }
-            stages_ss << '\n';
+            out << '\n';
         }
-        stages_ss << "  ]";
-        fields.push_back(stages_ss.str());
+        out << "  ]";
     }
 
     {
-        std::ostringstream inst_ss;
+        next_field();
         if (report.stage_instrumentation.empty()) {
-            inst_ss << "  \"stage_instrumentation\": []";
+            out << "  \"stage_instrumentation\": []";
         } else {
-            inst_ss << "  \"stage_instrumentation\": [\n";
+            out << "  \"stage_instrumentation\": [\n";
             for (std::size_t i = 0; i < report.stage_instrumentation.size(); ++i) {
                 const auto& entry = report.stage_instrumentation[i];
-                inst_ss << "    {\n"
-                        << "      \"label\": \"" << json_escape(entry.label) << "\",\n"
-                        << "      \"index\": " << entry.index << ",\n"
-                        << "      \"avg_ns\": " << entry.avg_ns << ",\n"
-                        << "      \"max_ns\": " << entry.max_ns << ",\n"
-                        << "      \"avg_cycles\": " << entry.avg_cycles << ",\n"
-                        << "      \"max_cycles\": " << entry.max_cycles << ",\n"
-                        << "      \"max_scratch_bytes\": " << entry.max_scratch_bytes << "\n"
-                        << "    }";
+                out << "    {\n"
+                    << "      \"label\": \"" << json_escape(entry.label) << "\",\n"
+                    << "      \"index\": " << entry.index << ",\n"
+                    << "      \"avg_ns\": " << entry.avg_ns << ",\n"
+                    << "      \"max_ns\": " << entry.max_ns << ",\n"
+                    << "      \"avg_cycles\": " << entry.avg_cycles << ",\n"
+                    << "      \"max_cycles\": " << entry.max_cycles << ",\n"
+                    << "      \"max_scratch_bytes\": " << entry.max_scratch_bytes << "\n"
+                    << "    }";
                 if (i + 1 < report.stage_instrumentation.size()) {
-                    inst_ss << ',';
+                    out << ',';
                 }
-                inst_ss << '\n';
+                out << '\n';
             }
-            inst_ss << "  ]";
+            out << "  ]";
         }
-        fields.push_back(inst_ss.str());
     }
 
-    out << "{\n";
-    for (std::size_t i = 0; i < fields.size(); ++i) {
-        out << fields[i];
-        if (i + 1 < fields.size()) {
-            out << ',';
-        }
-        out << '\n';
-    }
-    out << "}\n";
+    out << "\n}\n";
 }
 
 std::vector<StageComparisonResult> compare_with_reference(const StageOutputs& outputs,
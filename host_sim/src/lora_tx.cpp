@@ -14,6 +14,7 @@
 #include <fstream>
 #include <iomanip>
 #include <iostream>
+#include <limits>
 #include <numbers>
 #include <optional>
 #include <random>
@@ -238,6 +239,9 @@ std::vector<std::complex<float>> modulate_packet(
     const int signal_syms = preamble_len + 2 + 3 + data_sym_count; // preamble+sync+SFD+data
     const int pad_syms = std::max(preamble_len + 12, signal_syms / 2);
     const auto pad_len = static_cast<std::size_t>(sps) * static_cast<std::size_t>(pad_syms);
+    iq.reserve(2 * pad_len
+               + static_cast<std::size_t>(sps) * static_cast<std::size_t>(signal_syms - 1)
+               + static_cast<std::size_t>(sps / 4));
     iq.resize(pad_len, {0.0f, 0.0f});
 
     auto base_chirps = host_sim::build_chirps(sf, os_factor);
@@ -262,10 +266,23 @@ std::vector<std::complex<float>> modulate_packet(
     iq.insert(iq.end(), base_chirps.downchirp.begin(),
               base_chirps.downchirp.begin() + sps / 4);
 
-    // Data symbols: modulated upchirps
+    // Data symbols: modulated upchirps. Each symbol value's chirp is built
+    // once; repeats copy the samples already written for its first use.
+    constexpr std::size_t kNotEmitted = std::numeric_limits<std::size_t>::max();
+    const int n_bins = 1 << sf;
+    std::vector<std::size_t> emitted_at(static_cast<std::size_t>(n_bins), kNotEmitted);
     for (uint16_t sym : data_symbols) {
-        auto sym_chirp = host_sim::build_chirps_with_id(sf, os_factor, sym);
-        iq.insert(iq.end(), sym_chirp.upchirp.begin(), sym_chirp.upchirp.end());
+        const std::size_t offset = iq.size();
+        std::size_t& first = emitted_at[sym & (n_bins - 1)];
+        if (first == kNotEmitted) {
+            auto sym_chirp = host_sim::build_chirps_with_id(sf, os_factor, sym);
+            iq.insert(iq.end(), sym_chirp.upchirp.begin(), sym_chirp.upchirp.end());
+            first = offset;
+        } else {
+            iq.resize(offset + static_cast<std::size_t>(sps));
+            std::copy_n(iq.begin() + static_cast<std::ptrdiff_t>(first), sps,
+                        iq.begin() + static_cast<std::ptrdiff_t>(offset));
+        }
     }
 
     // Trailing silence
@@ -35,22 +35,27 @@ namespace host_sim
 
 std::vector<uint8_t> WhiteningSequencer::sequence(std::size_t count) const
 {
-    std::vector<uint8_t> result;
-    result.reserve(count);
-
-    for (std::size_t i = 0; i < count; ++i) {
-        result.push_back(kWhiteningSequence[i % kWhiteningPeriod]);
+    // The LFSR output repeats every period, so emit it one whole period at a
+    // time rather than indexing the table modulo the period per byte.
+    std::vector<uint8_t> result(count);
+    for (std::size_t offset = 0; offset < count; offset += kWhiteningPeriod) {
+        const std::size_t chunk = std::min(kWhiteningPeriod, count - offset);
+        std::copy_n(kWhiteningSequence, chunk, result.begin() + static_cast<std::ptrdiff_t>(offset));
     }
     return result;
 }
 
 std::vector<uint8_t> WhiteningSequencer::apply(const std::vector<uint8_t>& payload) const
 {
+    // XOR straight against the table, one period at a time, instead of
+    // materialising a payload-sized sequence first.
     std::vector<uint8_t> whitened(payload.size());
-    const auto seq = sequence(payload.size());
-    std::transform(payload.begin(), payload.end(), seq.begin(), whitened.begin(), [](uint8_t data, uint8_t mask) {
-        return static_cast<uint8_t>(data ^ mask);
-    });
+    for (std::size_t offset = 0; offset < payload.size(); offset += kWhiteningPeriod) {
+        const std::size_t chunk = std::min(kWhiteningPeriod, payload.size() - offset);
+        for (std::size_t i = 0; i < chunk; ++i) {
+            whitened[offset + i] = static_cast<uint8_t>(payload[offset + i] ^ kWhiteningSequence[i]);
+        }
+    }
     return whitened;
 }
 
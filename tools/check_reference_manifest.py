@@ -14,16 +14,25 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
 
 def sha256_file(path: Path) -> str:
     digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
+    # Reuse one buffer for every read instead of allocating a fresh bytes
+    # object per chunk; captures can be hundreds of megabytes.
+    buffer = bytearray(1024 * 1024)
+    view = memoryview(buffer)
+    with path.open("rb", buffering=0) as handle:
+        while True:
+            size = handle.readinto(buffer)
+            if not size:
+                break
+            digest.update(view[:size])
     return digest.hexdigest()
 
 
@@ -31,26 +40,31 @@ def verify_entry(base_dir: Path, entry: Dict) -> Iterable[Tuple[str, Path]]:
     """Yield (kind, path) pairs for files that failed verification."""
     capture_path = base_dir / entry["capture"]
     expected_capture_hash = entry.get("sha256")
+    # Open the files directly instead of probing with exists() first: a
+    # missing file surfaces as FileNotFoundError, saving one stat per entry.
     if expected_capture_hash:
-        if not capture_path.exists():
+        try:
+            actual_hash = sha256_file(capture_path)
+        except FileNotFoundError:
             yield ("missing capture", capture_path)
         else:
-            actual_hash = sha256_file(capture_path)
             if actual_hash != expected_capture_hash:
                 yield ("capture checksum mismatch", capture_path)
 
     stage_hashes = entry.get("stage_dump_sha256", {})
+    capture_stem = Path(entry["capture"]).stem
     for stage, expected_hash in stage_hashes.items():
-        stage_file = base_dir / f"{Path(entry['capture']).stem}_{stage}.txt"
-        if not stage_file.exists():
+        stage_file = base_dir / f"{capture_stem}_{stage}.txt"
+        try:
+            actual_stage_hash = sha256_file(stage_file)
+        except FileNotFoundError:
             yield (f"missing stage {stage}", stage_file)
             continue
-        actual_stage_hash = sha256_file(stage_file)
         if actual_stage_hash != expected_hash:
             yield (f"stage {stage} checksum mismatch", stage_file)
 
 
-def main() -> int:
+def main(argv: Optional[Iterable[str]] = None) -> int:
     parser = argparse.ArgumentParser(
         description="Validate reference stage manifest against files on disk."
     )
@@ -66,7 +80,13 @@ def main() -> int:
         help="Directory containing the CF32 captures and stage dumps "
         "(default: gr_lora_sdr/data/generated)",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of files to hash concurrently (default: CPU count)",
+    )
+    args = parser.parse_args(argv)
 
     if not args.manifest.exists():
         print(f"[manifest] missing file: {args.manifest}", file=sys.stderr)
@@ -75,16 +95,17 @@ def main() -> int:
         print(f"[manifest] data directory missing: {args.data_dir}", file=sys.stderr)
         return 2
 
-    entries = json.loads(args.manifest.read_text())
-    failures = []
-    for entry in entries:
-        for kind, path in verify_entry(args.data_dir, entry):
-            failures.append((kind, path))
+    entries = json.loads(args.manifest.read_bytes())
+    # hashlib releases the GIL while digesting large buffers, so a thread pool
+    # overlaps both the reads and the hashing of independent captures.
+    jobs = max(1, min(args.jobs or os.cpu_count() or 1, len(entries)))
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(lambda entry: list(verify_entry(args.data_dir, entry)), entries)
+        failures = [failure for entry_failures in results for failure in entry_failures]
 
     if failures:
-        print("[manifest] verification FAILED:", file=sys.stderr)
-        for kind, path in failures:
-            print(f"  - {kind}: {path}", file=sys.stderr)
+        report = "\n".join(f"  - {kind}: {path}" for kind, path in failures)
+        print(f"[manifest] verification FAILED:\n{report}", file=sys.stderr)
         return 1
 
     print(
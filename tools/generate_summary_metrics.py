@@ -7,7 +7,9 @@ from __future__ import annotations
 import argparse
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable, Optional
 
 
 def run_lora_replay(binary: Path, capture: Path, summary: Path) -> None:
@@ -20,7 +22,15 @@ def run_lora_replay(binary: Path, capture: Path, summary: Path) -> None:
         raise RuntimeError(f"lora_replay failed for {capture} (exit {result.returncode})")
 
 
-def main() -> int:
+def is_up_to_date(summary: Path, capture_mtime: int, binary_mtime: int) -> bool:
+    try:
+        summary_mtime = summary.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+    return summary_mtime >= max(capture_mtime, binary_mtime)
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("manifest", type=Path, help="Path to reference manifest JSON")
     parser.add_argument("data_dir", type=Path, help="Directory containing reference captures")
@@ -31,21 +41,58 @@ def main() -> int:
         default=Path("host_sim/lora_replay"),
         help="Path to the lora_replay executable (default: host_sim/lora_replay)",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of lora_replay processes to run concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip captures whose summary is newer than both the capture and lora_replay",
+    )
+    args = parser.parse_args(argv)
 
-    manifest_entries = json.loads(args.manifest.read_text())
+    manifest_entries = json.loads(args.manifest.read_bytes())
     binary = args.lora_replay.resolve()
     if not binary.exists():
         raise FileNotFoundError(f"lora_replay executable not found: {binary}")
 
+    binary_mtime = binary.stat().st_mtime_ns
+    # Resolve the data directory once; resolving every capture path would
+    # walk and stat each component again per manifest entry.
+    data_dir = args.data_dir.resolve()
+    jobs = []
     for entry in manifest_entries:
         capture_name = entry["capture"]
-        capture_path = (args.data_dir / capture_name).resolve()
-        if not capture_path.exists():
-            raise FileNotFoundError(f"Capture missing: {capture_path}")
+        capture_path = data_dir / capture_name
+        # One stat per capture serves the existence check, the freshness
+        # check and the size ordering below.
+        try:
+            capture_stat = capture_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Capture missing: {capture_path}") from None
         summary_path = args.output_dir / capture_name.replace(".cf32", ".json")
-        print(f"[summary] {capture_name} -> {summary_path}")
-        run_lora_replay(binary, capture_path, summary_path)
+        if args.incremental and is_up_to_date(summary_path, capture_stat.st_mtime_ns, binary_mtime):
+            print(f"[summary] {capture_name} up to date, skipping")
+            continue
+        jobs.append((capture_name, capture_path, summary_path, capture_stat.st_size))
+
+    if args.jobs > 1:
+        # Start the longest decodes first so one large capture submitted last
+        # does not leave the rest of the pool idle while it finishes.
+        jobs.sort(key=lambda job: job[3], reverse=True)
+
+    # Each capture is decoded by an independent lora_replay process, so threads
+    # are enough to keep several of them busy at once.
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = []
+        for capture_name, capture_path, summary_path, _ in jobs:
+            print(f"[summary] {capture_name} -> {summary_path}")
+            futures.append(pool.submit(run_lora_replay, binary, capture_path, summary_path))
+        for future in futures:
+            future.result()
 
     return 0
 
@@ -7,6 +7,10 @@ from __future__ import annotations
 import argparse
 import subprocess
 from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import compare_summary_metrics
+import generate_summary_metrics
 
 
 def run(cmd: list[str]) -> None:
@@ -15,6 +19,12 @@ def run(cmd: list[str]) -> None:
         raise RuntimeError(f"Command failed ({result.returncode}): {' '.join(cmd)}")
 
 
+def run_in_process(entry: Callable[[Optional[Iterable[str]]], int], argv: list[str]) -> None:
+    returncode = entry(argv)
+    if returncode != 0:
+        raise RuntimeError(f"Command failed ({returncode}): {entry.__module__} {' '.join(argv)}")
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("manifest", type=Path)
@@ -22,30 +32,38 @@ def main() -> int:
     parser.add_argument("summary_dir", type=Path)
     parser.add_argument("baseline", type=Path)
     parser.add_argument("--lora-replay", type=Path, default=Path("host_sim/lora_replay"))
-    parser.add_argument("--python", default="python3")
+    parser.add_argument(
+        "--python",
+        default=None,
+        help="Run each step under this interpreter instead of in-process",
+    )
+    parser.add_argument("--jobs", type=int, default=1)
     args = parser.parse_args()
 
-    generate_cmd = [
-        args.python,
-        str(Path(__file__).parent / "generate_summary_metrics.py"),
+    generate_args = [
         str(args.manifest),
         str(args.data_dir),
         str(args.summary_dir),
         "--lora-replay",
         str(args.lora_replay),
+        "--jobs",
+        str(args.jobs),
     ]
-    compare_cmd = [
-        args.python,
-        str(Path(__file__).parent / "compare_summary_metrics.py"),
+    compare_args = [
         str(args.baseline),
         str(args.summary_dir),
     ]
 
-    run(generate_cmd)
-    run(compare_cmd)
+    if args.python:
+        run([args.python, str(Path(__file__).parent / "generate_summary_metrics.py"), *generate_args])
+        run([args.python, str(Path(__file__).parent / "compare_summary_metrics.py"), *compare_args])
+    else:
+        # Both steps are plain Python; calling them directly avoids paying
+        # interpreter start-up twice per check.
+        run_in_process(generate_summary_metrics.main, generate_args)
+        run_in_process(compare_summary_metrics.main, compare_args)
     return 0
 
 
 if __name__ == "__main__":
     raise SystemExit(main())
-